@@ -1,12 +1,28 @@
 from fastapi import FastAPI
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.staticfiles import StaticFiles
 from app.routers.web import router as web_router
 
+
+class VersionedStaticFiles(StaticFiles):
+    """StaticFiles that lets browsers keep content-versioned (?v=...) assets for a year"""
+    
+    async def get_response(self, path, scope):
+        response = await super().get_response(path, scope)
+        if response.status_code == 200 and b"v=" in scope.get("query_string", b""):
+            response.headers["Cache-Control"] = "public, max-age=31536000, immutable"
+        return response
+
+
 app = FastAPI(title="Kampu-Hire HR Platform")
 app.include_router(web_router)
 
+# Compress everything else sizeable (candidates page, static CSS/JS, JSON);
+# responses that already carry Content-Encoding are passed through untouched
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=6)
+
 # Mount static files for CSS/JS
-app.mount("/static", StaticFiles(directory="app/static"), name="static")
+app.mount("/static", VersionedStaticFiles(directory="app/static"), name="static")
 
 @app.get("/health")
 async def health_check():
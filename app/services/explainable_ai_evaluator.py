@@ -3,17 +3,68 @@ Pure LLM Resume Evaluation Service with Explainable AI
 Let SEA-LION AI handle evaluation with transparent SHAP-like explanations
 """
 
+import copy
 import json
 import hashlib
 import re
+import threading
+from collections import OrderedDict
 from typing import Dict, Any, List
 from app.services.sealion_skill_extractor import SEALionSkillExtractor
 
+# Patterns for recovering fields from malformed LLM output
+_JSON_BLOCK_RE = re.compile(r'\{.*?\}', re.DOTALL)
+_SCORE_RE = re.compile(r'"overall_score":\s*([\d.]+)')
+_RECOMMENDATION_RE = re.compile(r'"recommendation":\s*"([^"]+)"')
+_SKILLS_RE = re.compile(r'"relevant_skills_found":\s*\[(.*?)\]', re.DOTALL)
+_QUOTED_RE = re.compile(r'"([^"]+)"')
+_EXPERIENCE_RELEVANCE_RE = re.compile(r'"experience_relevance":\s*([\d.]+)')
+_YEARS_RE = re.compile(r'"years_of_experience":\s*(\d+)')
+_EDUCATION_LEVEL_RE = re.compile(r'"education_level":\s*"([^"]+)"')
+_CONFIDENCE_RE = re.compile(r'"confidence_level":\s*([\d.]+)')
+
+# Looser patterns for last-resort extraction, tried in order
+_EMERGENCY_SCORE_RES = [re.compile(p, re.IGNORECASE) for p in (
+    r'"overall_score":\s*([\d.]+)',
+    r'"overall_score".*?:\s*([\d.]+)',
+    r'overall.*?score.*?:\s*([\d.]+)',
+    r'score.*?:\s*([\d.]+)',
+)]
+_EMERGENCY_RECOMMENDATION_RES = [re.compile(p, re.IGNORECASE) for p in (
+    r'"recommendation":\s*"([^"]+)"',
+    r'recommendation.*?:\s*"([^"]+)"',
+    r'"(hire|interview|reject)"',
+)]
+
+# Number of recent LLM evaluations kept for identical resume/job inputs
+EVALUATION_CACHE_SIZE = 128
+
 class SimpleAIEvaluator:
     """Pure LLM-based evaluator with explainable AI features"""
     
     def __init__(self):
         self.extractor = SEALionSkillExtractor()
+        self._cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+    
+    def _cache_key(self, resume_text: str, job_title: str, job_description: str) -> str:
+        data = f"{job_title}\0{job_description}\0{resume_text}"
+        return hashlib.sha256(data.encode()).hexdigest()
+    
+    def _get_cached(self, key: str) -> Dict[str, Any] | None:
+        with self._cache_lock:
+            result = self._cache.get(key)
+            if result is None:
+                return None
+            self._cache.move_to_end(key)
+        return copy.deepcopy(result)
+    
+    def _store_cached(self, key: str, result: Dict[str, Any]) -> None:
+        with self._cache_lock:
+            self._cache[key] = copy.deepcopy(result)
+            self._cache.move_to_end(key)
+            while len(self._cache) > EVALUATION_CACHE_SIZE:
+                self._cache.popitem(last=False)
     
     def evaluate_resume(self, resume_text: str, job_title: str, job_description: str = None) -> Dict[str, Any]:
         """
@@ -28,6 +79,13 @@ class SimpleAIEvaluator:
             if not job_description:
                 job_description = f"We are looking for a qualified {job_title} candidate"
             
+            # Identical resume for the same job: reuse the previous LLM evaluation
+            cache_key = self._cache_key(resume_text, job_title, job_description)
+            cached = self._get_cached(cache_key)
+            if cached is not None:
+                print(f"♻️ Reusing cached evaluation for {candidate_id}")
+                return cached
+            
             # Enhanced prompt for explainable evaluation
             evaluation_prompt = f"""You are an expert HR recruiter with explainable AI capabilities. Evaluate this candidate for: {job_title}
 
@@ -116,6 +174,7 @@ Ensure all weight contributions sum to 1.0 and provide specific, actionable insi
                     result = self._process_explainable_evaluation(evaluation_data, candidate_id, job_title)
                     print(f"   Final result score: {result.get('overall_score', 'missing')}")
                     print(f"   Final result recommendation: {result.get('recommendation', 'missing')}")
+                    self._store_cached(cache_key, result)
                     return result
                 else:
                     print(f"❌ No evaluation data recovered from LLM response")
@@ -130,6 +189,7 @@ Ensure all weight contributions sum to 1.0 and provide specific, actionable insi
                     if emergency_data:
                         print(f"Emergency recovery successful!")
                         result = self._process_explainable_evaluation(emergency_data, candidate_id, job_title)
+                        self._store_cached(cache_key, result)
                         return result
                 
                 return self._fallback_explainable_evaluation(candidate_id, job_title, resume_text)
@@ -163,7 +223,7 @@ Ensure all weight contributions sum to 1.0 and provide specific, actionable insi
             # Try aggressive recovery methods
             try:
                 # Method 1: Find complete JSON blocks
-                json_match = re.search(r'\{.*?\}', response_text, re.DOTALL)
+                json_match = _JSON_BLOCK_RE.search(response_text)
                 if json_match:
                     json_text = json_match.group()
                     return json.loads(json_text)
@@ -175,23 +235,22 @@ Ensure all weight contributions sum to 1.0 and provide specific, actionable insi
                 result = {}
                 
                 # Extract overall score
-                score_match = re.search(r'"overall_score":\s*([\d.]+)', response_text)
+                score_match = _SCORE_RE.search(response_text)
                 if score_match:
                     result['overall_score'] = float(score_match.group(1))
                     print(f"Recovered overall_score: {result['overall_score']}")
                 
                 # Extract recommendation
-                rec_match = re.search(r'"recommendation":\s*"([^"]+)"', response_text)
+                rec_match = _RECOMMENDATION_RE.search(response_text)
                 if rec_match:
                     result['recommendation'] = rec_match.group(1)
                     print(f"Recovered recommendation: {result['recommendation']}")
                 
                 # Extract relevant skills
-                skills_pattern = r'"relevant_skills_found":\s*\[(.*?)\]'
-                skills_match = re.search(skills_pattern, response_text, re.DOTALL)
+                skills_match = _SKILLS_RE.search(response_text)
                 if skills_match:
                     skills_text = skills_match.group(1)
-                    skills = re.findall(r'"([^"]+)"', skills_text)
+                    skills = _QUOTED_RE.findall(skills_text)
                     result['skills_analysis'] = {
                         'relevant_skills_found': skills,
                         'skill_match_score': result.get('overall_score', 0.5)
@@ -199,8 +258,8 @@ Ensure all weight contributions sum to 1.0 and provide specific, actionable insi
                     print(f"Recovered skills: {skills}")
                 
                 # Extract experience data
-                exp_rel_match = re.search(r'"experience_relevance":\s*([\d.]+)', response_text)
-                years_match = re.search(r'"years_of_experience":\s*(\d+)', response_text)
+                exp_rel_match = _EXPERIENCE_RELEVANCE_RE.search(response_text)
+                years_match = _YEARS_RE.search(response_text)
                 if exp_rel_match or years_match:
                     result['experience_analysis'] = {}
                     if exp_rel_match:
@@ -209,12 +268,12 @@ Ensure all weight contributions sum to 1.0 and provide specific, actionable insi
                         result['experience_analysis']['years_of_experience'] = int(years_match.group(1))
                 
                 # Extract education level
-                edu_match = re.search(r'"education_level":\s*"([^"]+)"', response_text)
+                edu_match = _EDUCATION_LEVEL_RE.search(response_text)
                 if edu_match:
                     result['education_analysis'] = {'education_level': edu_match.group(1)}
                 
                 # Extract confidence level
-                conf_match = re.search(r'"confidence_level":\s*([\d.]+)', response_text)
+                conf_match = _CONFIDENCE_RE.search(response_text)
                 if conf_match:
                     result['confidence_level'] = float(conf_match.group(1))
                 
@@ -233,18 +292,9 @@ Ensure all weight contributions sum to 1.0 and provide specific, actionable insi
         """Last resort data extraction from LLM response"""
         result = {}
         try:
-            import re
-            
             # Extract overall score (most critical)
-            score_patterns = [
-                r'"overall_score":\s*([\d.]+)',
-                r'"overall_score".*?:\s*([\d.]+)',
-                r'overall.*?score.*?:\s*([\d.]+)',
-                r'score.*?:\s*([\d.]+)'
-            ]
-            
-            for pattern in score_patterns:
-                match = re.search(pattern, response_text, re.IGNORECASE)
+            for pattern in _EMERGENCY_SCORE_RES:
+                match = pattern.search(response_text)
                 if match:
                     try:
                         score = float(match.group(1))
@@ -256,14 +306,8 @@ Ensure all weight contributions sum to 1.0 and provide specific, actionable insi
                         continue
             
             # Extract recommendation
-            rec_patterns = [
-                r'"recommendation":\s*"([^"]+)"',
-                r'recommendation.*?:\s*"([^"]+)"',
-                r'"(hire|interview|reject)"'
-            ]
-            
-            for pattern in rec_patterns:
-                match = re.search(pattern, response_text, re.IGNORECASE)
+            for pattern in _EMERGENCY_RECOMMENDATION_RES:
+                match = pattern.search(response_text)
                 if match:
                     rec = match.group(1).lower()
                     if rec in ['hire', 'interview', 'reject']:
@@ -519,7 +563,17 @@ Ensure all weight contributions sum to 1.0 and provide specific, actionable insi
         }
 
 
+# Global instance
+_evaluator = None
+
+def get_evaluator() -> SimpleAIEvaluator:
+    """Get singleton evaluator instance"""
+    global _evaluator
+    if _evaluator is None:
+        _evaluator = SimpleAIEvaluator()
+    return _evaluator
+
 def evaluate_candidate_simple(resume_text: str, job_title: str, job_description: str = None) -> Dict[str, Any]:
     """Convenience function for simple evaluation"""
-    evaluator = SimpleAIEvaluator()
+    evaluator = get_evaluator()
     return evaluator.evaluate_resume(resume_text, job_title, job_description)
\ No newline at end of file
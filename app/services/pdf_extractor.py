@@ -4,8 +4,14 @@ Extracts actual text content from uploaded PDF and DOC files
 """
 
 import os
+import asyncio
+import re
 import tempfile
 import logging
+import multiprocessing
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Optional
 
@@ -32,6 +38,12 @@ except ImportError:
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# A line break plus any surrounding whitespace (including blank lines)
+_LINE_BREAK_RE = re.compile(r'\s*\n\s*')
+
+# Number of recent extractions kept for re-uploads of an identical file
+TEXT_CACHE_SIZE = 128
+
 class DocumentTextExtractor:
     """Extract text from PDF and DOCX files"""
     
@@ -45,14 +57,47 @@ class DocumentTextExtractor:
             self.available_methods.append('docx')
         
         logger.info(f"Available extraction methods: {self.available_methods}")
+        
+        self._cache: "OrderedDict[str, str]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+    
+    def _get_cached(self, key: str) -> Optional[str]:
+        with self._cache_lock:
+            text = self._cache.get(key)
+            if text is not None:
+                self._cache.move_to_end(key)
+            return text
+    
+    def _store_cached(self, key: str, text: str) -> None:
+        with self._cache_lock:
+            self._cache[key] = text
+            self._cache.move_to_end(key)
+            while len(self._cache) > TEXT_CACHE_SIZE:
+                self._cache.popitem(last=False)
+    
+    async def extract_text_in_pool(self, file_path: str, content_hash: Optional[str] = None) -> str:
+        """
+        Extract text in a pool worker process, awaiting it without holding a thread
+        Given the file's content hash, an identical earlier upload's text is reused instead
+        """
+        loop = asyncio.get_running_loop()
+        if content_hash is None:
+            return await loop.run_in_executor(get_extraction_pool(), _extract_in_worker, file_path)
+        
+        # The extension picks the parser, so it is part of the key
+        cache_key = f"{content_hash}{Path(file_path).suffix.lower()}"
+        text = self._get_cached(cache_key)
+        if text is None:
+            text = await loop.run_in_executor(get_extraction_pool(), _extract_in_worker, file_path)
+            if text:
+                self._store_cached(cache_key, text)
+        return text
     
     def extract_pdf_text_pymupdf(self, file_path: str) -> str:
         """Extract text using PyMuPDF (fastest and most reliable)"""
         try:
             doc = fitz.open(file_path)
-            text = ""
-            for page in doc:
-                text += page.get_text()
+            text = "".join(page.get_text() for page in doc)
             doc.close()
             return text.strip()
         except Exception as e:
@@ -80,9 +125,7 @@ class DocumentTextExtractor:
         """Extract text from DOCX files"""
         try:
             doc = Document(file_path)
-            text = ""
-            for paragraph in doc.paragraphs:
-                text += paragraph.text + "\n"
+            text = "\n".join(paragraph.text for paragraph in doc.paragraphs)
             return text.strip()
         except Exception as e:
             logger.error(f"DOCX extraction failed: {e}")
@@ -141,17 +184,8 @@ class DocumentTextExtractor:
         if not text:
             return ""
         
-        # Remove excessive whitespace
-        lines = text.split('\n')
-        cleaned_lines = []
-        
-        for line in lines:
-            line = line.strip()
-            if line:  # Skip empty lines
-                cleaned_lines.append(line)
-        
-        # Join with single newlines and limit length
-        cleaned_text = '\n'.join(cleaned_lines)
+        # Strip every line and drop empty ones in a single pass
+        cleaned_text = _LINE_BREAK_RE.sub('\n', text.strip())
         
         # Limit text length to prevent overwhelming the AI
         if len(cleaned_text) > 8000:
@@ -231,10 +265,32 @@ def get_text_extractor() -> DocumentTextExtractor:
         _extractor = DocumentTextExtractor()
     return _extractor
 
-def extract_resume_text(file_path: str) -> str:
-    """Convenience function to extract text from resume file"""
-    extractor = get_text_extractor()
-    return extractor.extract_text_from_file(file_path)
+# Worker processes for parsing; PDF/DOCX parsing holds the GIL, so threads
+# alone would serialize concurrent uploads
+_pool = None
+
+def get_extraction_pool() -> ProcessPoolExecutor:
+    """Get singleton process pool for text extraction"""
+    global _pool
+    if _pool is None:
+        # Spawned rather than forked: the web server's threads must not be copied
+        _pool = ProcessPoolExecutor(mp_context=multiprocessing.get_context('spawn'))
+    return _pool
+
+def _extract_in_worker(file_path: str) -> str:
+    """Text extraction as run inside a pool worker"""
+    return get_text_extractor().extract_text_from_file(file_path)
+
+def extract_resume_text(file_path: str, content_hash: Optional[str] = None) -> str:
+    """
+    Convenience function to extract text from resume file
+    For callers without an event loop; see extract_resume_text_async
+    """
+    return asyncio.run(extract_resume_text_async(file_path, content_hash))
+
+async def extract_resume_text_async(file_path: str, content_hash: Optional[str] = None) -> str:
+    """Awaitable resume text extraction for use on the event loop"""
+    return await get_text_extractor().extract_text_in_pool(file_path, content_hash)
 
 def analyze_resume_sections(file_path: str) -> dict:
     """Extract and analyze key resume sections"""
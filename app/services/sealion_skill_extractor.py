@@ -11,6 +11,9 @@ from typing import Dict, List, Optional, Any
 import requests
 from app.core.config import settings
 
+_JSON_OBJECT_RE = re.compile(r'\{.*\}', re.DOTALL)
+_FALLBACK_KEYWORDS_RE = re.compile(r'\b(?:python|java|javascript|sql|machine learning|data science|aws|docker|git)\b')
+
 
 class SEALionSkillExtractor:
     """SEA-LION AI-powered intelligent skill extraction for hiring context"""
@@ -18,6 +21,8 @@ class SEALionSkillExtractor:
     def __init__(self):
         self.skill_extraction_prompt = self._create_skill_extraction_prompt()
         self.experience_analysis_prompt = self._create_experience_analysis_prompt()
+        # Keep-alive session so consecutive extraction calls reuse one connection
+        self.session = requests.Session()
     
     def extract_comprehensive_profile(self, cv_text: str, job_position: str = None) -> Dict[str, Any]:
         """Extract comprehensive candidate profile using SEA-LION AI"""
@@ -283,7 +288,7 @@ class SEALionSkillExtractor:
             if settings.RATE_LIMIT_DELAY > 0:
                 time.sleep(settings.RATE_LIMIT_DELAY)
             
-            response = requests.post(url, headers=headers, json=data, timeout=60)
+            response = self.session.post(url, headers=headers, json=data, timeout=60)
             response.raise_for_status()
             content = response.json()['choices'][0]['message']['content']
             
@@ -310,8 +315,7 @@ class SEALionSkillExtractor:
             print(f"JSON parsing error for {extraction_type}: {content}")
             
             # Try to extract JSON from the response with regex as a fallback
-            import re
-            json_match = re.search(r'\{.*\}', content, re.DOTALL)
+            json_match = _JSON_OBJECT_RE.search(content)
             if json_match:
                 try:
                     return json.loads(json_match.group())
@@ -365,7 +369,7 @@ class SEALionSkillExtractor:
     def _create_fallback_profile(self, cv_text: str) -> Dict[str, Any]:
         """Create basic fallback profile when extraction fails"""
         # Basic keyword extraction as fallback
-        keywords = re.findall(r'\b(?:python|java|javascript|sql|machine learning|data science|aws|docker|git)\b', cv_text.lower())
+        keywords = _FALLBACK_KEYWORDS_RE.findall(cv_text.lower())
         
         return {
             'skills': {
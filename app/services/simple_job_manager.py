@@ -3,14 +3,85 @@ CSV-based Job Management System for HR Portal
 Stores jobs and applications in CSV files for easy data analysis
 """
 
+import asyncio
+import bisect
 import json
 import csv
 import os
+import threading
+from collections import Counter
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterator, Optional, Tuple
 import hashlib
 
+# Job columns the HR dashboard cards actually show
+JOB_SUMMARY_FIELDS = (
+    'job_id', 'title', 'status', 'urgency', 'created_at', 'description',
+    'required_skills', 'salary_range', 'location', 'employment_type',
+)
+
+# Job columns served to applicants, with the value used when a column is absent
+PUBLIC_JOB_FIELDS = {
+    'job_id': '', 'title': '', 'company': '', 'description': '', 'requirements': '',
+    'employment_type': 'full-time', 'work_location': 'remote', 'location': '',
+    'experience_level': 'mid', 'salary_range': '', 'benefits': '', 'required_skills': '',
+    'preferred_skills': '', 'technologies': '', 'education_level': '',
+    'language_requirements': '', 'application_deadline': '', 'start_date': '',
+    'company_size': '', 'company_description': '', 'website': '', 'created_at': '',
+}
+
+# Columns of evaluations.csv: results appended once an application's
+# background evaluation completes; the latest row per application wins
+EVALUATION_FIELDS = (
+    'application_id', 'resume_text', 'overall_score', 'recommendation', 'skills_found',
+    'experience_match', 'education_match', 'culture_fit', 'ai_reasoning',
+    'key_strengths', 'improvement_areas',
+)
+
+# Single-pass table for flattening multi-line text into one CSV-friendly line
+_NEWLINES_TO_SPACES = str.maketrans('\r\n', '  ')
+
+
+def _parse_list(value: str) -> List[Any]:
+    """Parse a list column stored as JSON or as a Python list literal"""
+    if not value or value == '[]':
+        return []
+    try:
+        # Try JSON first
+        return json.loads(value)
+    except:
+        # Fall back to eval for Python list strings like "['item1', 'item2']"
+        try:
+            return eval(value) if isinstance(eval(value), list) else []
+        except:
+            return []
+
+
+def _indexed_rows(f) -> Tuple[List[str], Iterator[Tuple[int, Dict[str, str]]]]:
+    """Header and (byte offset, row) pairs of a CSV file opened in binary mode"""
+    position = 0
+    
+    def lines():
+        # csv pulls lines only as a row needs them, so position is the end
+        # of the row just returned
+        nonlocal position
+        for line in f:
+            position += len(line)
+            yield line.decode('utf-8')
+    
+    reader = csv.DictReader(lines())
+    fields = reader.fieldnames or []
+    
+    def rows():
+        start = position
+        for row in reader:
+            yield start, row
+            start = position
+    
+    return fields, rows()
+
+
 class SimpleJobManager:
     def __init__(self, data_dir: str = "data"):
         self.data_dir = Path(data_dir)
@@ -19,6 +90,28 @@ class SimpleJobManager:
         # CSV file paths
         self.jobs_csv = self.data_dir / "jobs.csv"
         self.applications_csv = self.data_dir / "applications.csv"
+        self.evaluations_csv = self.data_dir / "evaluations.csv"
+        
+        # Bumped on every write so callers can cheaply detect changes
+        self.version = 0
+        
+        # job_id -> (required_skills as stored, display tags parsed from it)
+        self._skill_tags: Dict[str, Tuple[str, List[str]]] = {}
+        
+        # Index mirrored from applications.csv: job_id -> sorted submitted_at
+        # stamps, application_id -> byte offset of its row and job_id -> its
+        # rows' offsets, plus the file size they reflect so outside appends
+        # trigger a rescan
+        self._submissions: Dict[str, List[str]] = {}
+        self._application_offsets: Dict[str, int] = {}
+        self._job_offsets: Dict[str, List[int]] = {}
+        self._application_fields: List[str] = []
+        self._index_size = -1
+        # application_id -> byte offset of its latest evaluations.csv row
+        self._evaluation_offsets: Dict[str, int] = {}
+        self._evaluation_fields: List[str] = []
+        self._evaluations_size = -1
+        self._index_lock = threading.Lock()
         
         # Initialize CSV files if they don't exist
         self._init_csv_files()
@@ -49,6 +142,11 @@ class SimpleJobManager:
                     'submitted_at', 'overall_score', 'recommendation', 'skills_found', 'experience_match',
                     'education_match', 'culture_fit', 'ai_reasoning', 'key_strengths', 'improvement_areas'
                 ])
+        
+        # Evaluations CSV headers
+        if not self.evaluations_csv.exists():
+            with open(self.evaluations_csv, 'w', newline='', encoding='utf-8') as f:
+                csv.writer(f).writerow(EVALUATION_FIELDS)
     
     def _generate_job_id(self) -> str:
         """Generate unique job ID"""
@@ -104,6 +202,8 @@ class SimpleJobManager:
         with open(self.jobs_csv, 'a', newline='', encoding='utf-8') as f:
             writer = csv.writer(f)
             writer.writerow([job[key] for key in job.keys()])
+        self._cache_skill_tags(job_id, job['required_skills'])
+        self.version += 1
         
         return job
     
@@ -111,33 +211,179 @@ class SimpleJobManager:
         """Get all jobs from CSV"""
         jobs = []
         if self.jobs_csv.exists():
+            counts = self.get_application_counts()
             with open(self.jobs_csv, 'r', newline='', encoding='utf-8') as f:
                 reader = csv.DictReader(f)
                 for row in reader:
                     # Update application count
-                    app_count = self._count_applications(row['job_id'])
-                    row['application_count'] = app_count
+                    row['application_count'] = counts.get(row['job_id'], (0, 0))[0]
                     jobs.append(row)
         return jobs
     
+    def list_job_summaries(self) -> List[Dict[str, Any]]:
+        """Get every job projected to JOB_SUMMARY_FIELDS, without application counts
+        
+        The description is replaced by description_snippet: its first 150
+        characters, with '...' only when something was cut.
+        """
+        summaries = []
+        if self.jobs_csv.exists():
+            with open(self.jobs_csv, 'r', newline='', encoding='utf-8') as f:
+                reader = csv.reader(f)
+                header = next(reader, [])
+                columns = [(field, header.index(field)) for field in JOB_SUMMARY_FIELDS if field in header]
+                for row in reader:
+                    summary = {field: row[i] if i < len(row) else None for field, i in columns}
+                    description = summary.pop('description', None) or ''
+                    summary['description_snippet'] = description[:150] + ('...' if len(description) > 150 else '')
+                    summaries.append(summary)
+        return summaries
+    
+    async def list_job_summaries_async(self) -> List[Dict[str, Any]]:
+        """list_job_summaries on a worker thread, keeping the event loop free"""
+        return await asyncio.to_thread(self.list_job_summaries)
+    
+    def list_public_jobs(self) -> List[Dict[str, Any]]:
+        """Get active jobs projected to PUBLIC_JOB_FIELDS, without application counts"""
+        jobs = []
+        if self.jobs_csv.exists():
+            with open(self.jobs_csv, 'r', newline='', encoding='utf-8') as f:
+                reader = csv.reader(f)
+                header = next(reader, [])
+                status = header.index('status') if 'status' in header else None
+                columns = [
+                    (field, header.index(field) if field in header else None, default)
+                    for field, default in PUBLIC_JOB_FIELDS.items()
+                ]
+                for row in reader:
+                    if status is not None and (row[status] if status < len(row) else None) != 'active':
+                        continue
+                    jobs.append({
+                        field: default if i is None else row[i] if i < len(row) else None
+                        for field, i, default in columns
+                    })
+        return jobs
+    
+    async def list_public_jobs_async(self) -> List[Dict[str, Any]]:
+        """list_public_jobs on a worker thread, keeping the event loop free"""
+        return await asyncio.to_thread(self.list_public_jobs)
+    
+    def _cache_skill_tags(self, job_id: str, required_skills: str) -> List[str]:
+        """Parse and remember the first five required skills of a job"""
+        tags = [skill.strip() for skill in required_skills.split(',')[:5] if skill.strip()]
+        self._skill_tags[job_id] = (required_skills, tags)
+        return tags
+    
+    def get_skill_tags(self, job: Dict[str, Any]) -> List[str]:
+        """Display tags for a job's required skills, parsed once per job"""
+        required_skills = job.get('required_skills', '')
+        cached = self._skill_tags.get(job['job_id'])
+        if cached and cached[0] == required_skills:
+            return cached[1]
+        return self._cache_skill_tags(job['job_id'], required_skills)
+    
     def get_job(self, job_id: str) -> Dict[str, Any]:
         """Get specific job by ID"""
-        jobs = self.list_jobs()
-        for job in jobs:
-            if job['job_id'] == job_id:
-                return job
+        if self.jobs_csv.exists():
+            with open(self.jobs_csv, 'r', newline='', encoding='utf-8') as f:
+                reader = csv.DictReader(f)
+                for row in reader:
+                    if row['job_id'] == job_id:
+                        row['application_count'] = self._count_applications(job_id)
+                        return row
         return None
     
+    @staticmethod
+    def _file_size(path: Path) -> int:
+        """Current size of a data file in bytes (0 if missing)"""
+        try:
+            return path.stat().st_size
+        except FileNotFoundError:
+            return 0
+    
+    def data_stamp(self) -> str:
+        """Size and mtime of the jobs, applications and evaluations CSVs, changed by any process's writes"""
+        parts = []
+        for path in (self.jobs_csv, self.applications_csv, self.evaluations_csv):
+            try:
+                stat = path.stat()
+                parts.append(f"{stat.st_mtime_ns:x}.{stat.st_size:x}")
+            except FileNotFoundError:
+                parts.append('0')
+        return '-'.join(parts)
+    
+    def _applications_size(self) -> int:
+        """Current size of applications.csv in bytes (0 if missing)"""
+        return self._file_size(self.applications_csv)
+    
+    def _load_submissions(self) -> Dict[str, List[str]]:
+        """Per-job submission stamps, rescanning the CSV only when it changed on disk
+        
+        The same scan records where each application's row starts, for
+        get_application and get_job_applications. Callers must hold _index_lock.
+        """
+        size = self._applications_size()
+        if size != self._index_size:
+            submissions: Dict[str, List[str]] = {}
+            offsets: Dict[str, int] = {}
+            job_offsets: Dict[str, List[int]] = {}
+            fields: List[str] = []
+            if size:
+                with open(self.applications_csv, 'rb') as f:
+                    fields, rows = _indexed_rows(f)
+                    for start, row in rows:
+                        submissions.setdefault(row['job_id'], []).append(row.get('submitted_at') or '')
+                        offsets[row['application_id']] = start
+                        job_offsets.setdefault(row['job_id'], []).append(start)
+            for stamps in submissions.values():
+                stamps.sort()
+            self._submissions = submissions
+            self._application_offsets = offsets
+            self._job_offsets = job_offsets
+            self._application_fields = fields
+            self._index_size = size
+        return self._submissions
+    
+    def _load_evaluations(self) -> Dict[str, int]:
+        """Offsets of each application's latest evaluation row, rescanned only on change
+        
+        Callers must hold _index_lock.
+        """
+        size = self._file_size(self.evaluations_csv)
+        if size != self._evaluations_size:
+            offsets: Dict[str, int] = {}
+            fields: List[str] = []
+            if size:
+                with open(self.evaluations_csv, 'rb') as f:
+                    fields, rows = _indexed_rows(f)
+                    for start, row in rows:
+                        offsets[row['application_id']] = start
+            self._evaluation_offsets = offsets
+            self._evaluation_fields = fields
+            self._evaluations_size = size
+        return self._evaluation_offsets
+    
     def _count_applications(self, job_id: str) -> int:
         """Count applications for a job"""
-        count = 0
-        if self.applications_csv.exists():
-            with open(self.applications_csv, 'r', newline='', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    if row['job_id'] == job_id:
-                        count += 1
-        return count
+        with self._index_lock:
+            return len(self._load_submissions().get(job_id, ()))
+    
+    def get_application_counts(self, since_iso: str = '') -> Dict[str, Tuple[int, int]]:
+        """Count applications per job from the in-memory submission index
+        
+        Returns {job_id: (total, recent)} where recent counts applications
+        submitted after since_iso.
+        """
+        with self._index_lock:
+            submissions = self._load_submissions()
+            return {
+                job_id: (len(stamps), len(stamps) - bisect.bisect_right(stamps, since_iso))
+                for job_id, stamps in submissions.items()
+            }
+    
+    async def get_application_counts_async(self, since_iso: str = '') -> Dict[str, Tuple[int, int]]:
+        """get_application_counts on a worker thread, keeping the event loop free"""
+        return await asyncio.to_thread(self.get_application_counts, since_iso)
     
     def submit_application(self, job_id: str, candidate_name: str, candidate_email: str,
                           candidate_phone: str, candidate_summary: str, resume_filename: str,
@@ -156,8 +402,35 @@ class SimpleJobManager:
             'candidate_phone': candidate_phone,
             'candidate_summary': candidate_summary,
             'resume_filename': resume_filename,
-            'resume_text': resume_text.replace('\n', ' ').replace('\r', ' '),  # Clean for CSV but preserve full content
+            'resume_text': resume_text.translate(_NEWLINES_TO_SPACES),  # Clean for CSV but preserve full content
             'submitted_at': submitted_at,
+            **self._evaluation_columns(evaluation)
+        }
+        
+        # Append to CSV, keeping the application index in step when it was current
+        with self._index_lock:
+            offset = self._applications_size()
+            index_current = offset == self._index_size
+            with open(self.applications_csv, 'a', newline='', encoding='utf-8') as f:
+                writer = csv.writer(f)
+                writer.writerow([application[key] for key in application.keys()])
+            if index_current:
+                bisect.insort(self._submissions.setdefault(job_id, []), submitted_at)
+                self._application_offsets[application_id] = offset
+                self._job_offsets.setdefault(job_id, []).append(offset)
+                self._index_size = self._applications_size()
+        self.version += 1
+        
+        return {
+            'application_id': application_id,
+            'candidate_id': candidate_id,
+            'evaluation': evaluation
+        }
+    
+    @staticmethod
+    def _evaluation_columns(evaluation: Dict[str, Any]) -> Dict[str, Any]:
+        """The applications.csv columns that hold an evaluation"""
+        return {
             'overall_score': evaluation.get('overall_score', 0),
             'recommendation': evaluation.get('recommendation', 'unknown'),
             'skills_found': str(evaluation.get('skills_found', [])),
@@ -168,72 +441,156 @@ class SimpleJobManager:
             'key_strengths': str(evaluation.get('key_strengths', [])),
             'improvement_areas': str(evaluation.get('improvement_areas', []))
         }
+    
+    def complete_application(self, application_id: str, resume_text: str,
+                             evaluation: Dict[str, Any]) -> bool:
+        """Record the resume text and evaluation of an already submitted application
         
-        # Append to CSV
-        with open(self.applications_csv, 'a', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
-            writer.writerow([application[key] for key in application.keys()])
-        
-        return {
+        Appended to evaluations.csv, so other writers' rows are never touched.
+        Returns False when the application does not exist.
+        """
+        row = {
             'application_id': application_id,
-            'candidate_id': candidate_id,
-            'evaluation': evaluation
+            'resume_text': resume_text.translate(_NEWLINES_TO_SPACES),
+            **self._evaluation_columns(evaluation)
         }
+        
+        with self._index_lock:
+            self._load_submissions()
+            if application_id not in self._application_offsets:
+                return False
+            offset = self._file_size(self.evaluations_csv)
+            index_current = offset == self._evaluations_size
+            with open(self.evaluations_csv, 'a', newline='', encoding='utf-8') as f:
+                writer = csv.writer(f)
+                writer.writerow([row.get(field, '') for field in EVALUATION_FIELDS])
+            if index_current:
+                self._evaluation_offsets[application_id] = offset
+                self._evaluations_size = self._file_size(self.evaluations_csv)
+        self.version += 1
+        return True
+    
+    @staticmethod
+    def _parse_application(row: Dict[str, str]) -> Dict[str, Any]:
+        """Turn an applications.csv row into an application with its evaluation"""
+        # Convert string representations back to proper format
+        application = dict(row)
+        try:
+            application['evaluation'] = {
+                # Blank while the evaluation is pending or after it failed
+                'overall_score': float(row['overall_score']) if row['overall_score'] else None,
+                'recommendation': row['recommendation'],
+                'skills_found': _parse_list(row['skills_found']),
+                'experience_match': float(row['experience_match']) if row['experience_match'] else 0,
+                'education_match': float(row['education_match']) if row['education_match'] else 0,
+                'culture_fit': float(row['culture_fit']) if row['culture_fit'] else 0,
+                'reasoning': row['ai_reasoning'],
+                'key_strengths': _parse_list(row['key_strengths']),
+                'improvement_areas': _parse_list(row['improvement_areas'])
+            }
+        except:
+            application['evaluation'] = {
+                'overall_score': 0,
+                'recommendation': 'unknown',
+                'skills_found': [],
+                'experience_match': 0,
+                'education_match': 0,
+                'culture_fit': 0,
+                'reasoning': '',
+                'key_strengths': [],
+                'improvement_areas': []
+            }
+        return application
+    
+    @staticmethod
+    def _read_row(f, offset: int, fields: List[str]) -> Optional[Dict[str, str]]:
+        """The CSV row starting at offset in binary file f"""
+        f.seek(offset)
+        return next(csv.DictReader((line.decode('utf-8') for line in f), fieldnames=fields), None)
+    
+    def _with_evaluations(self, rows: List[Dict[str, str]]) -> List[Dict[str, Any]]:
+        """Parse application rows, overlaying each one's latest evaluations.csv row"""
+        with self._index_lock:
+            evaluation_offsets = self._load_evaluations()
+            offsets = [evaluation_offsets.get(row['application_id']) for row in rows]
+            fields = self._evaluation_fields
+        
+        if any(offset is not None for offset in offsets):
+            with open(self.evaluations_csv, 'rb') as f:
+                for row, offset in zip(rows, offsets):
+                    if offset is None:
+                        continue
+                    evaluation = self._read_row(f, offset, fields)
+                    if evaluation is None or evaluation['application_id'] != row['application_id']:
+                        # The file was rewritten behind the index; fall back to a scan
+                        evaluation = self._scan_latest_evaluation(row['application_id'])
+                    if evaluation:
+                        row.update((field, evaluation[field]) for field in EVALUATION_FIELDS[1:] if field in evaluation)
+        return [self._parse_application(row) for row in rows]
+    
+    def _scan_latest_evaluation(self, application_id: str) -> Optional[Dict[str, str]]:
+        """The last evaluations.csv row for an application, by full scan"""
+        latest = None
+        with open(self.evaluations_csv, 'r', newline='', encoding='utf-8') as f:
+            for row in csv.DictReader(f):
+                if row['application_id'] == application_id:
+                    latest = row
+        return latest
     
     def get_job_applications(self, job_id: str) -> List[Dict[str, Any]]:
-        """Get all applications for a specific job"""
-        applications = []
-        if self.applications_csv.exists():
+        """Get all applications for a specific job, reading only their rows"""
+        with self._index_lock:
+            self._load_submissions()
+            offsets = list(self._job_offsets.get(job_id, ()))
+            fields = self._application_fields
+        if not offsets:
+            return []
+        
+        with open(self.applications_csv, 'rb') as f:
+            rows = [self._read_row(f, offset, fields) for offset in offsets]
+        if any(row is None or row['job_id'] != job_id for row in rows):
+            # The file was rewritten behind the index; fall back to a scan
             with open(self.applications_csv, 'r', newline='', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    if row['job_id'] == job_id:
-                        # Convert string representations back to proper format
-                        application = dict(row)
-                        try:
-                            # Handle both JSON and Python list string formats
-                            def safe_parse_list(value):
-                                if not value or value == '[]':
-                                    return []
-                                try:
-                                    # Try JSON first
-                                    return json.loads(value)
-                                except:
-                                    # Fall back to eval for Python list strings like "['item1', 'item2']"
-                                    try:
-                                        return eval(value) if isinstance(eval(value), list) else []
-                                    except:
-                                        return []
-                            
-                            application['evaluation'] = {
-                                'overall_score': float(row['overall_score']) if row['overall_score'] else 0,
-                                'recommendation': row['recommendation'],
-                                'skills_found': safe_parse_list(row['skills_found']),
-                                'experience_match': float(row['experience_match']) if row['experience_match'] else 0,
-                                'education_match': float(row['education_match']) if row['education_match'] else 0,
-                                'culture_fit': float(row['culture_fit']) if row['culture_fit'] else 0,
-                                'reasoning': row['ai_reasoning'],
-                                'key_strengths': safe_parse_list(row['key_strengths']),
-                                'improvement_areas': safe_parse_list(row['improvement_areas'])
-                            }
-                        except:
-                            application['evaluation'] = {
-                                'overall_score': 0,
-                                'recommendation': 'unknown',
-                                'skills_found': [],
-                                'experience_match': 0,
-                                'education_match': 0,
-                                'culture_fit': 0,
-                                'reasoning': '',
-                                'key_strengths': [],
-                                'improvement_areas': []
-                            }
-                        applications.append(application)
-        return applications
+                rows = [row for row in csv.DictReader(f) if row['job_id'] == job_id]
+        return self._with_evaluations(rows)
+    
+    def get_application(self, application_id: str) -> Optional[Dict[str, Any]]:
+        """Get one application by ID, reading only its row, or None"""
+        with self._index_lock:
+            self._load_submissions()
+            offset = self._application_offsets.get(application_id)
+            fields = self._application_fields
+        if offset is None:
+            return None
+        
+        with open(self.applications_csv, 'rb') as f:
+            row = self._read_row(f, offset, fields)
+        if row is None or row['application_id'] != application_id:
+            # The file was rewritten behind the index; fall back to a scan
+            with open(self.applications_csv, 'r', newline='', encoding='utf-8') as f:
+                row = next((r for r in csv.DictReader(f) if r['application_id'] == application_id), None)
+            if row is None:
+                return None
+        return self._with_evaluations([row])[0]
     
     def get_application_stats(self, job_id: str) -> Dict[str, Any]:
         """Get application statistics for a job"""
+        return self._application_stats(self.get_job_applications(job_id))
+    
+    def get_job_with_candidates(self, job_id: str) -> Tuple[Dict[str, Any], List[Dict[str, Any]], Dict[str, Any]]:
+        """Get a job, its applications and their statistics from one applications scan
+        
+        The job is None when it does not exist.
+        """
+        job = self.get_job(job_id)
+        if job is None:
+            return None, [], self._application_stats([])
         applications = self.get_job_applications(job_id)
+        return job, applications, self._application_stats(applications)
+    
+    @staticmethod
+    def _application_stats(applications: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Summarise recommendations and scores over already-loaded applications"""
         total = len(applications)
         
         if total == 0:
@@ -245,19 +602,23 @@ class SimpleJobManager:
                 'average_score': 0
             }
         
-        hire_count = len([app for app in applications if app['recommendation'] == 'hire'])
-        interview_count = len([app for app in applications if app['recommendation'] == 'interview'])
-        reject_count = len([app for app in applications if app['recommendation'] == 'reject'])
-        
-        scores = [float(app['overall_score']) for app in applications if app['overall_score']]
-        avg_score = sum(scores) / len(scores) if scores else 0
+        # Tally recommendations and scores in a single pass
+        recommendations = Counter()
+        score_total = 0.0
+        scored = 0
+        for app in applications:
+            recommendations[app['recommendation']] += 1
+            # Pending and failed evaluations have a blank score and are not averaged
+            if app['overall_score']:
+                score_total += float(app['overall_score'])
+                scored += 1
         
         return {
             'total_applications': total,
-            'hire_recommended': hire_count,
-            'interview_recommended': interview_count,
-            'reject_recommended': reject_count,
-            'average_score': avg_score
+            'hire_recommended': recommendations['hire'],
+            'interview_recommended': recommendations['interview'],
+            'reject_recommended': recommendations['reject'],
+            'average_score': score_total / scored if scored else 0
         }
 
 # Global instance
@@ -7,6 +7,13 @@ NAMES_DIR = DATA_DIR / 'names'
 
 _NAME_CACHE: list[str] | None = None
 _NAME_RE: re.Pattern | None = None
+_ROLES_CACHE: dict | None = None
+
+_NAME_LINE_RE = re.compile(r'(?i)name\s*[:\-].*?(\n|$)')
+_EMAIL_RE = re.compile(r'[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}')
+_PHONE_RE = re.compile(r'\b\+?\d[\d\s().-]{6,}\b')
+_EDUCATION_LINE_RE = re.compile(r'(?i)education\s*[:\-].*?(\n|$)')
+_WS_RE = re.compile(r'\s+')
 
 
 def _load_names_from_disk() -> list[str]:
@@ -46,24 +53,32 @@ def anonymize_text(text: str) -> str:
     if not isinstance(text, str):
         return ''
     t = text
-    t = re.sub(r'(?i)name\s*[:\-].*?(\n|$)', ' ', t)
-    t = re.sub(r'[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}', ' ', t)
-    t = re.sub(r'\b\+?\d[\d\s().-]{6,}\b', ' ', t)
-    t = re.sub(r'(?i)education\s*[:\-].*?(\n|$)', ' ', t)
+    t = _NAME_LINE_RE.sub(' ', t)
+    t = _EMAIL_RE.sub(' ', t)
+    t = _PHONE_RE.sub(' ', t)
+    t = _EDUCATION_LINE_RE.sub(' ', t)
     pat = get_name_pattern()
     t = pat.sub(' name_token ', t)
-    t = re.sub(r'\s+', ' ', t)
+    t = _WS_RE.sub(' ', t)
     return t.strip()
 
 
+def get_role_presets() -> dict:
+    global _ROLES_CACHE
+    if _ROLES_CACHE is None:
+        import yaml
+        data_path = DATA_DIR / 'roles.yaml'
+        if not data_path.exists():
+            _ROLES_CACHE = {}
+        else:
+            _ROLES_CACHE = yaml.safe_load(data_path.read_text(encoding='utf-8')) or {}
+    return _ROLES_CACHE
+
+
 def load_role_keywords(role: str) -> list[str]:
     # Load presets from YAML, map best match by role name if available
-    import yaml
-    data_path = Path(__file__).resolve().parents[1]/'data'/'roles.yaml'
-    if not data_path.exists():
-        return []
     try:
-        obj = yaml.safe_load(data_path.read_text(encoding='utf-8')) or {}
+        obj = get_role_presets()
         # flatten sectors
         role_lower = role.lower()
         for sector, roles in obj.items():
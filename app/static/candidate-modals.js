@@ -0,0 +1,188 @@
+// Candidate detail modals, imported by candidates.js on the first click
+
+// One request per candidate serves the profile, evaluation and explainable
+// views; the pending or settled promise is kept so reopening is instant
+const candidateBundles = new Map();
+
+function getCandidateBundle(applicationId) {
+    if (!candidateBundles.has(applicationId)) {
+        const request = fetch(`/api/candidate/${applicationId}/bundle`)
+            .then(response => {
+                if (!response.ok) {
+                    throw new Error(`HTTP ${response.status}`);
+                }
+                return response.json();
+            })
+            .catch(error => {
+                // Let a later click retry instead of replaying the failure
+                candidateBundles.delete(applicationId);
+                throw error;
+            });
+        candidateBundles.set(applicationId, request);
+    }
+    return candidateBundles.get(applicationId);
+}
+
+function showModal(boxStyle, content) {
+    // Shared overlay and dialog box for the candidate detail views; content
+    // is either an HTML string or a ready-made DOM fragment
+    const modal = document.createElement('div');
+    modal.className = 'modal-overlay';
+    const box = document.createElement('div');
+    box.className = 'modal-box';
+    box.style.cssText = boxStyle;
+    if (typeof content === 'string') {
+        box.innerHTML = content;
+    } else {
+        box.append(content);
+    }
+    modal.append(box);
+    document.body.appendChild(modal);
+}
+
+function fillFields(root, values) {
+    // Set each [data-field] element's text; arrays become <li> items
+    for (const [field, value] of Object.entries(values)) {
+        const element = root.querySelector(`[data-field="${field}"]`);
+        if (Array.isArray(value)) {
+            element.replaceChildren(...value.map(item => {
+                const li = document.createElement('li');
+                li.textContent = item;
+                return li;
+            }));
+        } else {
+            element.textContent = value;
+        }
+    }
+}
+
+export function viewUnbiasedProfile(applicationId) {
+    // Show candidate profile without revealing name or bias-inducing information
+    getCandidateBundle(applicationId)
+        .then(bundle => {
+            const data = bundle.unbiased;
+            showModal('max-width: 600px;', `
+                <h3>Anonymous Candidate Profile</h3>
+                <div class="panel">
+                    <h4>Professional Summary</h4>
+                    <p>${data.summary || 'Not provided'}</p>
+                </div>
+                <div class="panel">
+                    <h4>Skills Identified</h4>
+                    <p>${data.skills?.join(', ') || 'None identified'}</p>
+                </div>
+                <div class="panel">
+                    <h4>Application Date</h4>
+                    <p>${data.applied_date}</p>
+                </div>
+                <button onclick="this.closest('.modal-overlay').remove()" class="modal-btn">Close</button>
+            `);
+        })
+        .catch(error => alert('Error loading candidate profile'));
+}
+
+export function viewAIEvaluation(applicationId) {
+    // Show detailed AI evaluation reasoning
+    getCandidateBundle(applicationId)
+        .then(bundle => {
+            const data = bundle.evaluation;
+            showModal('max-width: 700px;', `
+                <h3>🤖 AI Evaluation Analysis</h3>
+                <div class="panel success">
+                    <h4>Overall Score: ${data.overall_score_pct}%</h4>
+                    <p><strong>Recommendation:</strong> ${data.recommendation.toUpperCase()}</p>
+                </div>
+                <div class="panel">
+                    <h4>Scoring Breakdown</h4>
+                    <p><strong>Skills Match:</strong> ${data.experience_match_pct}%</p>
+                    <p><strong>Education Match:</strong> ${data.education_match_pct}%</p>
+                    <p><strong>Culture Fit:</strong> ${data.culture_fit_pct}%</p>
+                </div>
+                <div class="panel info">
+                    <h4>AI Reasoning</h4>
+                    <p style="line-height: 1.6;">${data.reasoning || 'No detailed reasoning provided'}</p>
+                </div>
+                <div class="panel info">
+                    <h4>Key Strengths</h4>
+                    <ul>${data.key_strengths?.map(s => `<li>${s}</li>`).join('') || '<li>None identified</li>'}</ul>
+                </div>
+                <div class="panel note">
+                    <h4>Growth Areas</h4>
+                    <ul>${data.improvement_areas?.map(s => `<li>${s}</li>`).join('') || '<li>None identified</li>'}</ul>
+                </div>
+                <button onclick="this.closest('.modal-overlay').remove()" class="modal-btn">Close</button>
+            `);
+        })
+        .catch(error => alert('Error loading AI evaluation'));
+}
+
+export function viewExplainableAI(applicationId) {
+    // Show explainable AI analysis with SHAP-like values
+    getCandidateBundle(applicationId)
+        .then(bundle => {
+            const data = bundle.explainable;
+            const analysis = data.component_analysis || {};
+            const skills = analysis.skills || {};
+            const experience = analysis.experience || {};
+            const education = analysis.education || {};
+            const culture = analysis.culture_fit || {};
+            const orNone = (items, fallback) => (items && items.length ? items : [fallback]);
+
+            // Clone the pre-parsed skeleton and fill in only the dynamic parts
+            const content = document.getElementById('tpl-explainable').content.cloneNode(true);
+            fillFields(content, {
+                overall_score: data.overall_score_pct,
+                confidence_level: data.confidence_level_pct,
+                skills_score: skills.score_pct || 0,
+                skills_weight: skills.weight_pct || 0,
+                skills_found: (skills.relevant_skills || []).join(', ') || 'None identified',
+                experience_score: experience.score_pct || 0,
+                experience_weight: experience.weight_pct || 0,
+                experience_years: experience.years || 'Unknown',
+                education_score: education.score_pct || 0,
+                education_weight: education.weight_pct || 0,
+                education_level: education.level || 'Unknown',
+                culture_score: culture.score_pct || 0,
+                culture_weight: culture.weight_pct || 0,
+                communication_style: culture.communication_style || 'Not assessed',
+                primary_strengths: orNone(data.primary_strengths, 'None identified'),
+                main_concerns: orNone(data.main_concerns, 'None identified'),
+                decision_drivers: orNone(data.decision_drivers, 'General assessment'),
+                hr_recommendations: data.hr_recommendations || ['Review application manually'],
+                reasoning: data.reasoning || 'No detailed reasoning available',
+            });
+            // Server-rendered and already escaped
+            content.querySelector('.feature-chart').innerHTML = data.feature_chart_html;
+            showModal('max-width: 900px; max-height: 90vh; width: 90%;', content);
+        })
+        .catch(error => {
+            console.error('Error:', error);
+            alert('Error loading explainable AI analysis');
+        });
+}
+
+export function revealIdentity(applicationId) {
+    // Only reveal identity after evaluation is complete
+    if (confirm('⚠️ BIAS WARNING: Revealing candidate identity may introduce unconscious bias. Are you sure you want to proceed?')) {
+        fetch(`/api/candidate/${applicationId}/identity`)
+            .then(response => response.json())
+            .then(data => {
+                showModal('max-width: 500px;', `
+                    <h3>Candidate Identity</h3>
+                    <div class="panel warning">
+                        <p><strong>⚠️ Bias Notice:</strong> This information is revealed only for contact purposes after evaluation.</p>
+                    </div>
+                    <div class="panel">
+                        <p><strong>Name:</strong> ${data.name}</p>
+                        <p><strong>Email:</strong> ${data.email}</p>
+                        <p><strong>Phone:</strong> ${data.phone || 'Not provided'}</p>
+                    </div>
+                    <div style="display: flex; gap: 1rem;">
+                        <button onclick="window.open('mailto:' + '${data.email}' + '?subject=Regarding your application')" class="modal-btn success">📧 Contact</button>
+                        <button onclick="this.closest('.modal-overlay').remove()" class="modal-btn secondary">Close</button>
+                    </div>
+                `);
+            })
+            .catch(error => alert('Error loading candidate identity'));
+    }
+}
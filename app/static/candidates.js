@@ -0,0 +1,75 @@
+function viewCandidateDetails(applicationId) {
+    // TODO: Implement candidate details modal
+    alert(`View candidate details: ${applicationId}`);
+}
+
+function viewResume(applicationId) {
+    // TODO: Implement resume viewer
+    alert(`View resume: ${applicationId}`);
+}
+
+function contactCandidate(applicationId) {
+    // TODO: Implement contact form
+    alert(`Contact candidate: ${applicationId}`);
+}
+
+function filterCandidates(filter) {
+    // TODO: Implement candidate filtering
+    console.log('Filter candidates:', filter);
+}
+
+function sortCandidates(sort) {
+    // TODO: Implement candidate sorting
+    console.log('Sort candidates:', sort);
+}
+
+function exportCandidates() {
+    // TODO: Implement data export
+    alert('Export candidates data coming soon!');
+}
+
+function bulkContact() {
+    // TODO: Implement bulk contact
+    alert('Bulk contact feature coming soon!');
+}
+
+function copyPortalUrl() {
+    const url = document.querySelector('.portal-url').textContent;
+    navigator.clipboard.writeText(url).then(() => {
+        alert('Application portal URL copied to clipboard!');
+    });
+}
+
+// The detail modals live in their own module, fetched on the first click
+// and reused by the browser for every later one
+const candidateModalsUrl = document.currentScript.dataset.modals;
+let candidateModals;
+
+function openModal(name, applicationId) {
+    if (!candidateModals) {
+        candidateModals = import(candidateModalsUrl).catch(error => {
+            // Let a later click retry the import
+            candidateModals = undefined;
+            throw error;
+        });
+    }
+    candidateModals
+        .then(modals => modals[name](applicationId))
+        .catch(error => alert('Error loading candidate details'));
+}
+
+function viewUnbiasedProfile(applicationId) {
+    openModal('viewUnbiasedProfile', applicationId);
+}
+
+function viewAIEvaluation(applicationId) {
+    openModal('viewAIEvaluation', applicationId);
+}
+
+function viewExplainableAI(applicationId) {
+    openModal('viewExplainableAI', applicationId);
+}
+
+function revealIdentity(applicationId) {
+    openModal('revealIdentity', applicationId);
+}
@@ -0,0 +1,54 @@
+function updateWeight(slider, valueId) {
+    document.getElementById(valueId).textContent = slider.value + '%';
+}
+
+function addQuestion() {
+    const questionsDiv = document.getElementById('screeningQuestions');
+    const questionItem = document.createElement('div');
+    questionItem.className = 'question-item';
+    questionItem.innerHTML = `
+        <input type="text" name="screening_questions[]" 
+               placeholder="Enter your screening question...">
+        <button type="button" onclick="removeQuestion(this)">❌</button>
+    `;
+    questionsDiv.appendChild(questionItem);
+}
+
+function removeQuestion(button) {
+    button.parentElement.remove();
+}
+
+function saveDraft() {
+    alert('Draft saved! (Feature coming soon)');
+}
+
+function previewJob() {
+    alert('Job preview coming soon!');
+}
+
+function submitJob(event) {
+    event.preventDefault();
+    
+    // Required fields are enforced by the browser (the `required`
+    // attributes) before this runs, and by the server's form model
+    const formData = new FormData(event.target);
+    
+    // Submit the form
+    fetch('/hr/jobs', {
+        method: 'POST',
+        body: formData
+    })
+    .then(response => {
+        if (response.ok) {
+            alert('Job posted successfully!');
+            closeModal('createJobModal');
+            window.location.reload();
+        } else {
+            alert('Error posting job. Please try again.');
+        }
+    })
+    .catch(error => {
+        console.error('Error:', error);
+        alert('Error posting job. Please try again.');
+    });
+}
@@ -0,0 +1,157 @@
+function showCreateForm() {
+    document.getElementById('createJobModal').classList.add('show');
+    loadCreateJobForm();
+}
+
+function closeModal(modalId) {
+    document.getElementById(modalId).classList.remove('show');
+}
+
+function loadCreateJobForm() {
+    fetch('/hr/create-job-form')
+        .then(response => response.text())
+        .then(html => {
+            document.getElementById('createJobContent').innerHTML = html;
+        });
+}
+
+function editJob(jobId) {
+    alert(`Edit job: ${jobId}`);
+    // TODO: Implement job editing
+}
+
+function viewApplications(jobId) {
+    window.location.href = `/hr/jobs/${jobId}/candidates`;
+}
+
+function toggleDropdown(jobId) {
+    const dropdown = document.getElementById(`dropdown-${jobId}`);
+    dropdown.classList.toggle('show');
+    
+    // Close other dropdowns
+    document.querySelectorAll('.dropdown-menu').forEach(menu => {
+        if (menu.id !== `dropdown-${jobId}`) {
+            menu.classList.remove('show');
+        }
+    });
+}
+
+function shareJob(jobId) {
+    const url = `http://localhost:8000/apply/${jobId}`;
+    navigator.clipboard.writeText(url).then(() => {
+        alert('Application portal URL copied to clipboard!');
+    });
+}
+
+function copyToClipboard(elementId) {
+    const element = document.getElementById(elementId);
+    navigator.clipboard.writeText(element.textContent).then(() => {
+        alert('URL copied to clipboard!');
+    });
+}
+
+let currentFilter = 'all';
+// Matches the server's page order (and the sort menu's first option)
+let currentSort = 'newest';
+
+function filterJobs(status) {
+    currentFilter = status;
+    const jobCards = document.querySelectorAll('.job-card');
+    jobCards.forEach(card => {
+        if (status === 'all' || card.dataset.status === status) {
+            card.style.display = 'block';
+        } else {
+            card.style.display = 'none';
+        }
+    });
+}
+
+let nextPage = Number(document.getElementById('jobsGrid').dataset.nextPage);
+function loadMoreJobs() {
+    const params = new URLSearchParams(window.location.search);
+    params.set('page', nextPage);
+    fetch(`/hr/jobs/cards?${params}`)
+        .then(response => response.text().then(html => {
+            document.getElementById('jobsGrid').insertAdjacentHTML('beforeend', html);
+            nextPage += 1;
+            // Newly loaded cards follow the current filter and sort
+            filterJobs(currentFilter);
+            sortJobs(currentSort);
+            if (response.headers.get('X-Has-More') !== '1') {
+                document.getElementById('loadMoreBtn').remove();
+            }
+        }))
+        .catch(error => {
+            console.error('Error loading jobs:', error);
+        });
+}
+
+const jobComparators = {
+    'newest': (a, b) => b.dataset.created.localeCompare(a.dataset.created),
+    'oldest': (a, b) => a.dataset.created.localeCompare(b.dataset.created),
+    'most-apps': (a, b) => b.dataset.apps - a.dataset.apps,
+    'urgent': (a, b) => a.dataset.urgency - b.dataset.urgency,
+};
+
+function sortJobs(criteria) {
+    const compare = jobComparators[criteria];
+    if (!compare) {
+        return;
+    }
+    currentSort = criteria;
+    const grid = document.getElementById('jobsGrid');
+    const jobCards = Array.from(grid.querySelectorAll('.job-card'));
+    jobCards.sort(compare).forEach(card => grid.appendChild(card));
+}
+
+function showAnalytics() {
+    alert('Analytics dashboard coming soon!');
+    // TODO: Implement analytics view
+}
+
+function exportData() {
+    alert('Data export coming soon!');
+    // TODO: Implement data export
+}
+
+function bulkActions() {
+    alert('Bulk actions coming soon!');
+    // TODO: Implement bulk actions
+}
+
+function pauseJob(jobId) {
+    if (confirm('Are you sure you want to pause this job?')) {
+        // TODO: Implement job pausing
+        alert(`Job ${jobId} paused`);
+    }
+}
+
+function closeJob(jobId) {
+    if (confirm('Are you sure you want to close this job? This will stop accepting new applications.')) {
+        // TODO: Implement job closing
+        alert(`Job ${jobId} closed`);
+    }
+}
+
+function duplicateJob(jobId) {
+    if (confirm('Create a copy of this job posting?')) {
+        // TODO: Implement job duplication
+        alert(`Job ${jobId} duplicated`);
+    }
+}
+
+// Close dropdowns when clicking outside
+document.addEventListener('click', function(event) {
+    if (!event.target.matches('.dropdown-toggle')) {
+        document.querySelectorAll('.dropdown-menu').forEach(menu => {
+            menu.classList.remove('show');
+        });
+    }
+});
+
+// Close modal when clicking outside
+document.addEventListener('click', function(event) {
+    if (event.target.classList.contains('modal')) {
+        event.target.classList.remove('show');
+    }
+});
@@ -0,0 +1,28 @@
+import unittest
+
+from fastapi.testclient import TestClient
+
+from app.main import app
+
+
+class CreateJobFormTest(unittest.TestCase):
+    """Validation of the HR create-job form"""
+    
+    def setUp(self):
+        self.client = TestClient(app)
+    
+    def test_empty_title_is_rejected(self):
+        response = self.client.post('/hr/jobs', data={
+            'title': '',
+            'description': 'Builds things',
+            'requirements': 'Python',
+            'company': 'Kampu',
+            'hr_contact': 'hr@example.com',
+        }, follow_redirects=False)
+        
+        self.assertEqual(response.status_code, 422)
+        self.assertEqual(response.json()['detail'][0]['loc'][-1], 'title')
+
+
+if __name__ == '__main__':
+    unittest.main()